@@ -2,49 +2,83 @@
 """Analyze mock trades data to calculate strategy performance metrics."""
 
 import csv
+import os
+import pickle
+import sys
 from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 
+# Columns read from the trades CSV, in the order iter_trades yields them
+TRADE_COLUMNS = ("strategy", "outcome", "profit_usd", "stake_usd")
 
-def load_trades(filepath: str) -> list[dict]:
-    """Load trades from CSV file."""
-    trades = []
-    with open(filepath, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            trades.append(row)
-    return trades
+# Bump when analyze_strategies or iter_trades change what a cached result holds
+STATS_CACHE_VERSION = 1
+
+RULE = "=" * 70
+THIN_RULE = "-" * 70
 
 
-def analyze_strategies(trades: list[dict]) -> dict:
-    """Calculate performance metrics for each strategy."""
+def iter_trades(filepath: str):
+    """Stream trades from CSV file as (strategy, outcome, profit_usd, stake_usd).
+
+    Only the columns used by the analysis are kept. Numeric fields are parsed
+    and outcomes normalized once as each row is read.
+    """
+    with open(filepath, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        si, oi, pi, ki = (header.index(name) for name in TRADE_COLUMNS)
+        width = max(si, oi, pi, ki) + 1
+        for row in reader:
+            if len(row) < width:
+                # Skip blank lines like DictReader; treat missing cells of a
+                # short row (e.g. a partially written last line) as empty
+                if not row:
+                    continue
+                row += [""] * (width - len(row))
+            profit = row[pi]
+            stake = row[ki]
+            yield (
+                row[si],
+                row[oi].strip(),
+                float(profit) if profit else 0.0,
+                float(stake) if stake else 0.0,
+            )
+
+
+def analyze_strategies(trades) -> tuple[dict, int, int]:
+    """Calculate performance metrics for each strategy in a single pass.
+
+    Accepts any iterable of trade tuples (e.g. from iter_trades) and returns
+    the per-strategy stats with the number of trades seen and still pending.
+    """
     stats = defaultdict(lambda: {
         "wins": 0,
         "losses": 0,
         "total_profit": 0.0,
         "total_staked": 0.0,
-        "trades": [],
     })
+    count = pending = 0
 
-    for trade in trades:
-        strategy = trade["strategy"]
-        outcome = trade["outcome"].strip()
+    for strategy, outcome, profit, stake in trades:
+        count += 1
 
         # Skip trades without outcomes (pending)
         if not outcome:
+            pending += 1
             continue
 
-        profit = float(trade["profit_usd"]) if trade["profit_usd"] else 0.0
-        stake = float(trade["stake_usd"]) if trade["stake_usd"] else 0.0
-
-        stats[strategy]["total_profit"] += profit
-        stats[strategy]["total_staked"] += stake
-        stats[strategy]["trades"].append(trade)
+        data = stats[strategy]
+        data["total_profit"] += profit
+        data["total_staked"] += stake
 
         if outcome == "WIN":
-            stats[strategy]["wins"] += 1
+            data["wins"] += 1
         elif outcome == "LOSS":
-            stats[strategy]["losses"] += 1
+            data["losses"] += 1
 
     # Calculate derived metrics
     for strategy, data in stats.items():
@@ -53,24 +87,55 @@ def analyze_strategies(trades: list[dict]) -> dict:
         data["win_rate"] = (data["wins"] / total * 100) if total > 0 else 0
         data["roi"] = (data["total_profit"] / data["total_staked"] * 100) if data["total_staked"] > 0 else 0
 
-    return dict(stats)
+    # Freeze the defaultdict in place instead of copying it into a plain dict
+    stats.default_factory = None
+    return stats, count, pending
+
+
+def get_stats(filepath) -> tuple[dict, int, int]:
+    """Return analyze_strategies results for a trades CSV.
+
+    Results are persisted next to the CSV as a ``.stats.pkl`` sidecar keyed on
+    the file's mtime and size and the analyzer's schema, so repeated runs skip
+    parsing an unchanged file.
+    """
+    st = os.stat(filepath)
+    key = (st.st_mtime_ns, st.st_size, STATS_CACHE_VERSION, TRADE_COLUMNS)
+    cache_path = Path(filepath).with_suffix(".stats.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, result = pickle.load(f)
+        if cached_key == key:
+            return result
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    result = analyze_strategies(iter_trades(filepath))
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return result
 
 
 def print_results(stats: dict) -> None:
     """Print analysis results in a formatted table."""
-    print("\n" + "=" * 70)
-    print("STRATEGY PERFORMANCE ANALYSIS")
-    print("=" * 70)
+    out = ["\n" + RULE, "STRATEGY PERFORMANCE ANALYSIS", RULE]
 
-    # Sort by win rate descending
-    sorted_strategies = sorted(stats.items(), key=lambda x: x[1]["win_rate"], reverse=True)
+    # Sort by win rate descending; keys are extracted once with itemgetter and
+    # the sort looks them up with a C-level list.__getitem__ instead of a lambda
+    names = list(stats)
+    win_rates = list(map(itemgetter("win_rate"), stats.values()))
+    order = sorted(range(len(names)), key=win_rates.__getitem__, reverse=True)
+    sorted_strategies = [(names[i], stats[names[i]]) for i in order]
 
     # Header
-    print(f"\n{'Strategy':<12} {'Wins':>6} {'Losses':>7} {'Total':>6} {'Win Rate':>10} {'Profit':>12} {'ROI':>10}")
-    print("-" * 70)
+    out.append(f"\n{'Strategy':<12} {'Wins':>6} {'Losses':>7} {'Total':>6} {'Win Rate':>10} {'Profit':>12} {'ROI':>10}")
+    out.append(THIN_RULE)
 
     for strategy, data in sorted_strategies:
-        print(
+        out.append(
             f"{strategy:<12} "
             f"{data['wins']:>6} "
             f"{data['losses']:>7} "
@@ -80,51 +145,59 @@ def print_results(stats: dict) -> None:
             f"{data['roi']:>9.1f}%"
         )
 
-    print("-" * 70)
-
-    # Summary
-    total_profit = sum(d["total_profit"] for d in stats.values())
-    total_staked = sum(d["total_staked"] for d in stats.values())
-    total_trades = sum(d["total_trades"] for d in stats.values())
-    total_wins = sum(d["wins"] for d in stats.values())
+    out.append(THIN_RULE)
 
-    print(f"\n{'TOTALS':<12} {total_wins:>6} {total_trades - total_wins:>7} {total_trades:>6} "
-          f"{(total_wins/total_trades*100) if total_trades else 0:>9.1f}% "
-          f"${total_profit:>10.2f} "
-          f"{(total_profit/total_staked*100) if total_staked else 0:>9.1f}%")
+    # Summary: totals and best-by-profit/ROI in a single pass
+    total_profit = total_staked = 0.0
+    total_trades = total_wins = 0
+    best_profit = best_roi = None
+    for strategy, data in stats.items():
+        total_profit += data["total_profit"]
+        total_staked += data["total_staked"]
+        total_trades += data["total_trades"]
+        total_wins += data["wins"]
+        if best_profit is None or data["total_profit"] > best_profit[1]["total_profit"]:
+            best_profit = (strategy, data)
+        if best_roi is None or data["roi"] > best_roi[1]["roi"]:
+            best_roi = (strategy, data)
+
+    out.append(f"\n{'TOTALS':<12} {total_wins:>6} {total_trades - total_wins:>7} {total_trades:>6} "
+               f"{(total_wins/total_trades*100) if total_trades else 0:>9.1f}% "
+               f"${total_profit:>10.2f} "
+               f"{(total_profit/total_staked*100) if total_staked else 0:>9.1f}%")
 
     # Best strategy
     best = sorted_strategies[0]
-    print(f"\nBest Strategy by Win Rate: {best[0]} ({best[1]['win_rate']:.1f}%)")
+    out.append(f"\nBest Strategy by Win Rate: {best[0]} ({best[1]['win_rate']:.1f}%)")
 
     # Best by profit
-    best_profit = max(stats.items(), key=lambda x: x[1]["total_profit"])
-    print(f"Best Strategy by Profit: {best_profit[0]} (${best_profit[1]['total_profit']:.2f})")
+    out.append(f"Best Strategy by Profit: {best_profit[0]} (${best_profit[1]['total_profit']:.2f})")
 
     # Best by ROI
-    best_roi = max(stats.items(), key=lambda x: x[1]["roi"])
-    print(f"Best Strategy by ROI: {best_roi[0]} ({best_roi[1]['roi']:.1f}%)")
+    out.append(f"Best Strategy by ROI: {best_roi[0]} ({best_roi[1]['roi']:.1f}%)")
 
-    print("\n" + "=" * 70)
+    out.append("\n" + RULE)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_detailed_breakdown(stats: dict) -> None:
     """Print detailed breakdown for each strategy."""
-    print("\nDETAILED BREAKDOWN")
-    print("-" * 70)
+    out = ["\nDETAILED BREAKDOWN", THIN_RULE]
 
     for strategy, data in sorted(stats.items()):
-        print(f"\n{strategy}:")
-        print(f"  Total Trades: {data['total_trades']}")
-        print(f"  Wins: {data['wins']}, Losses: {data['losses']}")
-        print(f"  Win Rate: {data['win_rate']:.2f}%")
-        print(f"  Total Staked: ${data['total_staked']:.2f}")
-        print(f"  Total Profit: ${data['total_profit']:.2f}")
-        print(f"  ROI: {data['roi']:.2f}%")
+        out.append(f"\n{strategy}:")
+        out.append(f"  Total Trades: {data['total_trades']}")
+        out.append(f"  Wins: {data['wins']}, Losses: {data['losses']}")
+        out.append(f"  Win Rate: {data['win_rate']:.2f}%")
+        out.append(f"  Total Staked: ${data['total_staked']:.2f}")
+        out.append(f"  Total Profit: ${data['total_profit']:.2f}")
+        out.append(f"  ROI: {data['roi']:.2f}%")
 
         if data['total_trades'] > 0:
             avg_profit_per_trade = data['total_profit'] / data['total_trades']
-            print(f"  Avg Profit/Trade: ${avg_profit_per_trade:.2f}")
+            out.append(f"  Avg Profit/Trade: ${avg_profit_per_trade:.2f}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -134,15 +207,12 @@ def main():
         print(f"Error: Could not find {data_path}")
         return 1
 
-    trades = load_trades(data_path)
-    print(f"Loaded {len(trades)} trades from {data_path}")
+    stats, total, pending = get_stats(data_path)
+    print(f"Loaded {total} trades from {data_path}")
 
-    # Count pending trades
-    pending = sum(1 for t in trades if not t["outcome"].strip())
     if pending:
         print(f"Note: {pending} trades are pending (no outcome yet)")
 
-    stats = analyze_strategies(trades)
     print_results(stats)
     print_detailed_breakdown(stats)
 
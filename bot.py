@@ -1,18 +1,35 @@
 import csv
 import os
+import pickle
+import signal
+import sys
 import time
-from collections import deque
+from bisect import bisect_right
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = "https://api.elections.kalshi.com/trade-api/v2"
 SERIES_TICKER = "KXBTC15M"
 POLL_SECONDS = 5
 STAKE_USD = 5.0
 TRADES_CSV = Path("data/mock_trades.csv")
+TRADES_SNAPSHOT = TRADES_CSV.with_suffix(".trades.pkl")  # Parsed copy of TRADES_CSV
+CONNECT_TIMEOUT_SECONDS = 3  # Per connect attempt; read timeouts are per call
+MARKETS_BULK_MAX = 100  # Tickers per bulk /markets request
+TRADE_FIELDNAMES = [
+    "time", "strategy", "previous_ticker", "previous_result", "buy_ticker", "buy_side",
+    "stake_usd", "price_usd", "contracts", "fee_usd", "gross_profit_usd",
+    "outcome", "payout_usd", "profit_usd", "close_time"
+]
 
 # Momentum strategy: track last 60 seconds of BTC prices
 MOMENTUM_WINDOW_SECONDS = 60
@@ -29,50 +46,186 @@ CONSENSUS_FEE_PCT = float(os.getenv("CONSENSUS_FEE_PCT", "0.0"))
 CONSENSUS_ROLLING_WINDOW = int(os.getenv("CONSENSUS_ROLLING_WINDOW", "30"))
 CONSENSUS_DAILY_LOSS_CAP_R = float(os.getenv("CONSENSUS_DAILY_LOSS_CAP_R", "3"))
 CONSENSUS_WEEKLY_LOSS_CAP_R = float(os.getenv("CONSENSUS_WEEKLY_LOSS_CAP_R", "8"))
+CONSENSUS_STRATEGIES = ("CONSENSUS", "CONSENSUS_2")
+
+
+def make_session():
+    """Create an HTTP session that keeps connections to Coinbase and Kalshi alive."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "simple-kalshi-bot",
+        "Accept": "application/json",
+    })
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        # Retry only failed connects, never a request that was sent and then
+        # stalled, so a retried call can't outlast the un-retried baseline
+        max_retries=Retry(total=2, read=0, backoff_factor=0.2),
+    )
+    session.mount("https://api.coinbase.com", adapter)
+    session.mount("https://api.elections.kalshi.com", adapter)
+    return session
+
+
+# `kill -USR1 <pid>` ends the current poll wait early (where sigtimedwait exists)
+WAKE_SIGNAL = signal.SIGUSR1 if hasattr(signal, "sigtimedwait") else None
+
+# Shared across all polls so each tick reuses pooled TCP/TLS connections
+SESSION = make_session()
+
+# Runs a tick's independent API requests concurrently over SESSION
+HTTP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="http")
+
+def parse_number(value, default=None):
+    """Parse a numeric CSV cell, keeping ints as ints so rows round-trip unchanged."""
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+@dataclass(slots=True)
+class Trade:
+    """One mock trade; a row of the trades CSV with numeric columns parsed.
+
+    None stands for an empty cell (e.g. the P&L columns of a pending trade).
+    """
+
+    time: str
+    strategy: str
+    previous_ticker: str
+    previous_result: str
+    buy_ticker: str
+    buy_side: str
+    stake_usd: float
+    price_usd: float
+    contracts: float
+    fee_usd: float | None = None
+    gross_profit_usd: float | None = None
+    outcome: str = ""
+    payout_usd: float | None = None
+    profit_usd: float | None = None
+    close_time: str = ""  # ISO close time of buy_ticker; empty for older rows
+    # (date ordinal, ISO year, ISO week) of time; derived, not a CSV column
+    calendar: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.calendar = trade_calendar(self.time)
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a Trade from a csv.DictReader row.
+
+        Low-cardinality text columns are interned so the long-lived trade
+        list shares one string per strategy, ticker, side and outcome.
+        """
+        return cls(
+            time=row.get("time") or "",
+            strategy=sys.intern(row.get("strategy") or ""),
+            previous_ticker=sys.intern(row.get("previous_ticker") or ""),
+            previous_result=row.get("previous_result") or "",
+            buy_ticker=sys.intern(row.get("buy_ticker") or ""),
+            buy_side=sys.intern(row.get("buy_side") or ""),
+            stake_usd=parse_number(row.get("stake_usd"), 0.0),
+            price_usd=parse_number(row.get("price_usd"), 0.0),
+            contracts=parse_number(row.get("contracts"), 0.0),
+            fee_usd=parse_number(row.get("fee_usd")),
+            gross_profit_usd=parse_number(row.get("gross_profit_usd")),
+            outcome=sys.intern(row.get("outcome") or ""),
+            payout_usd=parse_number(row.get("payout_usd")),
+            profit_usd=parse_number(row.get("profit_usd")),
+            close_time=sys.intern(row.get("close_time") or ""),
+        )
+
+    def to_row(self):
+        """Return the CSV row for this trade, with None written as an empty cell."""
+        row = {}
+        for name in TRADE_FIELDNAMES:
+            value = getattr(self, name)
+            row[name] = "" if value is None else value
+        return row
 
 
 def get_btc_price():
     """Get current BTC price from Coinbase."""
-    resp = requests.get(
+    resp = SESSION.get(
         "https://api.coinbase.com/v2/prices/BTC-USD/spot",
-        timeout=10
+        timeout=(CONNECT_TIMEOUT_SECONDS, 10)
     )
     resp.raise_for_status()
     return float(resp.json()["data"]["amount"])
 
 
+@lru_cache(maxsize=1024)
+def parse_close_time(value):
+    """Parse an API close_time such as "2026-01-05T00:15:00Z".
+
+    Memoized because the same open markets come back on every poll.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def get_open_market():
-    """Get the next expiring open KXBTC15M market."""
+    """Get the next expiring open KXBTC15M market.
+
+    Returns (market, close_time) with close_time already parsed, or
+    (None, None) when no open market is listed.
+    """
     params = {"series_ticker": SERIES_TICKER, "status": "open", "limit": 50}
-    resp = requests.get(f"{API_BASE}/markets", params=params, timeout=20)
+    resp = SESSION.get(f"{API_BASE}/markets", params=params, timeout=(CONNECT_TIMEOUT_SECONDS, 20))
     resp.raise_for_status()
 
     now = datetime.now(timezone.utc)
-    candidates = []
+    best = None
+    best_exp = None
 
     for market in resp.json().get("markets", []):
         close_time = market.get("close_time")
         if not close_time:
             continue
 
-        exp = datetime.fromisoformat(close_time.replace("Z", "+00:00"))
-        if exp > now:
-            candidates.append((exp, market))
+        exp = parse_close_time(close_time)
+        if exp > now and (best_exp is None or exp < best_exp):
+            best, best_exp = market, exp
 
-    if not candidates:
-        return None
-
-    _, best = min(candidates, key=lambda x: x[0])
-    return best
+    return best, best_exp
 
 
 def get_market(ticker):
     """Get a specific market by ticker."""
-    resp = requests.get(f"{API_BASE}/markets/{ticker}", timeout=20)
+    resp = SESSION.get(f"{API_BASE}/markets/{ticker}", timeout=(CONNECT_TIMEOUT_SECONDS, 20))
     resp.raise_for_status()
     return resp.json().get("market", {})
 
 
+def get_markets_bulk(tickers):
+    """Get several markets by ticker in as few requests as possible.
+
+    Returns a dict of ticker -> market for every ticker the API returned.
+    """
+    tickers = list(tickers)
+    markets = {}
+    for i in range(0, len(tickers), MARKETS_BULK_MAX):
+        chunk = tickers[i:i + MARKETS_BULK_MAX]
+        params = {"tickers": ",".join(chunk), "limit": len(chunk)}
+        resp = SESSION.get(f"{API_BASE}/markets", params=params, timeout=(CONNECT_TIMEOUT_SECONDS, 20))
+        resp.raise_for_status()
+        for market in resp.json().get("markets", []):
+            markets[market.get("ticker")] = market
+    return markets
+
+
+def price_at_or_before(btc_times, btc_prices, cutoff):
+    """Latest BTC price recorded at or before cutoff, or None if there is none yet."""
+    idx = bisect_right(btc_times, cutoff) - 1
+    if idx < 0:
+        return None
+    return btc_prices[idx][1]
+
+
 def get_settled_side(market):
     """Return 'yes' or 'no' if market is settled, else None."""
     result = market.get("result")
@@ -81,62 +234,145 @@ def get_settled_side(market):
     return None
 
 
+def trades_csv_key():
+    """Identify the current TRADES_CSV contents, column layout and Trade fields for the snapshot."""
+    st = TRADES_CSV.stat()
+    return st.st_mtime_ns, st.st_size, tuple(TRADE_FIELDNAMES), tuple(f.name for f in fields(Trade))
+
+
+def save_snapshot(trades):
+    """Pickle the parsed trades next to the CSV so an unchanged file loads without parsing."""
+    try:
+        key = trades_csv_key()
+        with TRADES_SNAPSHOT.open("wb") as f:
+            pickle.dump((key, trades), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
 def load_trades():
-    """Load all trades from CSV."""
+    """Load all trades from CSV.
+
+    The pickle snapshot is used instead when it was taken of the file as it
+    is now. A file written with an older column layout is rewritten in the
+    current one so that later appends line up with its header.
+    """
     if not TRADES_CSV.exists():
         return []
+    try:
+        with TRADES_SNAPSHOT.open("rb") as f:
+            key, trades = pickle.load(f)
+        if key == trades_csv_key():
+            return trades
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+        pass
+
     with TRADES_CSV.open() as f:
-        return list(csv.DictReader(f))
+        reader = csv.DictReader(f)
+        trades = [Trade.from_row(row) for row in reader]
+        fieldnames = reader.fieldnames
+    if trades and fieldnames != TRADE_FIELDNAMES:
+        save_trades(trades)
+    save_snapshot(trades)
+    return trades
+
+
+# New trades waiting to be appended to TRADES_CSV by flush_trades
+unflushed_trades = []
 
 
 def save_trades(trades):
-    """Save all trades to CSV."""
+    """Save all trades to CSV, rewriting the file."""
+    unflushed_trades.clear()  # The rewrite includes them
     if not trades:
         return
     TRADES_CSV.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "time", "strategy", "previous_ticker", "previous_result", "buy_ticker", "buy_side",
-        "stake_usd", "price_usd", "contracts", "fee_usd", "gross_profit_usd",
-        "outcome", "payout_usd", "profit_usd"
-    ]
     with TRADES_CSV.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=TRADE_FIELDNAMES)
         writer.writeheader()
-        writer.writerows(trades)
+        writer.writerows(t.to_row() for t in trades)
 
 
-def calc_stats(trades, strategy=None):
-    """Calculate stats from trades, optionally filtered by strategy."""
-    total_staked = 0.0
-    total_profit = 0.0
-    wins = 0
-    losses = 0
-    pending = 0
+def append_trade(trade):
+    """Queue a new trade to be appended to CSV on the next flush_trades."""
+    unflushed_trades.append(trade)
 
-    for t in trades:
-        if strategy and t.get("strategy") != strategy:
-            continue
-        total_staked += float(t.get("stake_usd", 0))
-        profit = t.get("profit_usd", "")
-        if profit != "":
-            p = float(profit)
-            total_profit += p
-            if p > 0:
-                wins += 1
-            else:
-                losses += 1
-        else:
-            pending += 1
 
+def flush_trades():
+    """Append all queued trades to CSV in one write, without rewriting existing rows."""
+    if not unflushed_trades:
+        return
+    TRADES_CSV.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not TRADES_CSV.exists() or TRADES_CSV.stat().st_size == 0
+    with TRADES_CSV.open("a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TRADE_FIELDNAMES)
+        if write_header:
+            writer.writeheader()
+        writer.writerows(t.to_row() for t in unflushed_trades)
+    unflushed_trades.clear()
+
+
+def awaiting_close(trade, now):
+    """True if the trade's market has not closed yet, so it cannot be settled."""
+    close_time = parse_trade_time(trade.close_time)
+    return close_time is not None and close_time > now
+
+
+def empty_stats():
+    """Zeroed per-strategy stats: staked, profit, wins, losses, pending."""
     return {
-        "total_staked": total_staked,
-        "total_profit": total_profit,
-        "wins": wins,
-        "losses": losses,
-        "pending": pending,
+        "total_staked": 0.0,
+        "total_profit": 0.0,
+        "wins": 0,
+        "losses": 0,
+        "pending": 0,
     }
 
 
+def build_stats_cache(trades):
+    """Build per-strategy stats once; keep them current with stats_add/stats_settle."""
+    cache = defaultdict(empty_stats)
+    for t in trades:
+        stats_add(cache, t)
+    return cache
+
+
+def combined_stats(cache):
+    """Sum every strategy's stats in the cache into one totals dict."""
+    total = empty_stats()
+    for stats in cache.values():
+        for key, value in stats.items():
+            total[key] += value
+    return total
+
+
+def stats_add(cache, trade):
+    """Account for a newly recorded (or loaded) trade in the stats cache."""
+    stats = cache[trade.strategy]
+    stats["total_staked"] += trade.stake_usd
+    p = trade.profit_usd
+    if p is not None:
+        stats["total_profit"] += p
+        if p > 0:
+            stats["wins"] += 1
+        else:
+            stats["losses"] += 1
+    else:
+        stats["pending"] += 1
+
+
+def stats_settle(cache, trade):
+    """Move a just-settled trade from pending to a win or loss in the stats cache."""
+    stats = cache[trade.strategy]
+    p = trade.profit_usd
+    stats["pending"] -= 1
+    stats["total_profit"] += p
+    if p > 0:
+        stats["wins"] += 1
+    else:
+        stats["losses"] += 1
+
+
 def parse_trade_time(value):
     """Parse ISO trade timestamp."""
     if not value:
@@ -147,75 +383,128 @@ def parse_trade_time(value):
         return None
 
 
+def trade_calendar(value):
+    """Return (date ordinal, ISO year, ISO week) of a trade timestamp, or None.
+
+    Computed once per trade and kept on Trade.calendar, since trade
+    timestamps never change once written.
+    """
+    ts = parse_trade_time(value)
+    if not ts:
+        return None
+    year, week, _ = ts.isocalendar()
+    return ts.toordinal(), year, week
+
+
 def settled_consensus(trades):
     """Return settled consensus trades in insertion order."""
     return [
         t for t in trades
-        if t.get("strategy") in ("CONSENSUS", "CONSENSUS_2") and t.get("outcome")
+        if t.strategy in CONSENSUS_STRATEGIES and t.outcome
     ]
 
 
-def consensus_bankroll(trades):
-    """Current consensus bankroll from realized P&L."""
+def consensus_bankroll(settled):
+    """Current consensus bankroll from realized P&L of settled consensus trades."""
     realized = sum(
-        float(t.get("profit_usd", 0))
-        for t in settled_consensus(trades)
+        t.profit_usd or 0.0
+        for t in settled
     )
     return INITIAL_BANKROLL_USD + realized
 
 
-def consensus_period_pnl(trades, now):
-    """Return today's and this ISO week's realized consensus P&L."""
+def consensus_period_pnl(settled, now):
+    """Return today's and this ISO week's realized P&L of settled consensus trades."""
     daily = 0.0
     weekly = 0.0
-    now_date = now.date()
+    now_ord = now.toordinal()
     now_year, now_week, _ = now.isocalendar()
 
-    for t in settled_consensus(trades):
-        ts = parse_trade_time(t.get("time", ""))
-        if not ts:
+    for t in settled:
+        cal = t.calendar
+        if not cal:
             continue
-        profit = float(t.get("profit_usd", 0))
-        if ts.date() == now_date:
+        date_ord, year, week = cal
+        profit = t.profit_usd or 0.0
+        if date_ord == now_ord:
             daily += profit
-        year, week, _ = ts.isocalendar()
         if year == now_year and week == now_week:
             weekly += profit
 
     return daily, weekly
 
 
-def rolling_consensus_metrics(trades):
-    """Return rolling consensus performance and break-even win rate."""
-    settled = settled_consensus(trades)
-    if not settled:
+class RollingConsensus:
+    """Sliding window over the most recent settled consensus profits.
+
+    Win/loss sums and counts are updated as profits enter and leave the
+    window, so reading the metrics does not rescan any trades.
+    """
+
+    def __init__(self, window):
+        self.profits = deque(maxlen=window if window > 0 else None)
+        self.win_sum = 0.0
+        self.win_count = 0
+        self.loss_sum = 0.0
+        self.loss_count = 0
+
+    def _apply(self, profit, sign):
+        if profit > 0:
+            self.win_sum += sign * profit
+            self.win_count += sign
+        else:
+            self.loss_sum += sign * profit
+            self.loss_count += sign
+
+    def push(self, profit):
+        """Add a settled profit, evicting the oldest one if the window is full."""
+        if self.profits.maxlen is not None and len(self.profits) == self.profits.maxlen:
+            self._apply(self.profits[0], -1)
+        self.profits.append(profit)
+        self._apply(profit, 1)
+
+    def metrics(self):
+        """Return rolling consensus performance and break-even win rate."""
+        sample_size = len(self.profits)
+        if not sample_size:
+            return {
+                "sample_size": 0,
+                "win_rate": 0.0,
+                "break_even_win_rate": 1.0,
+            }
+
+        win_rate = self.win_count / sample_size
+
+        if self.win_count and self.loss_count:
+            avg_win = self.win_sum / self.win_count
+            avg_loss = abs(self.loss_sum / self.loss_count)
+            break_even = avg_loss / (avg_win + avg_loss) if (avg_win + avg_loss) else 1.0
+        elif self.win_count and not self.loss_count:
+            break_even = 0.0
+        else:
+            break_even = 1.0
+
         return {
-            "sample_size": 0,
-            "win_rate": 0.0,
-            "break_even_win_rate": 1.0,
+            "sample_size": sample_size,
+            "win_rate": win_rate,
+            "break_even_win_rate": break_even,
         }
 
-    window = settled[-CONSENSUS_ROLLING_WINDOW:]
-    profits = [float(t.get("profit_usd", 0)) for t in window]
-    wins = [p for p in profits if p > 0]
-    losses = [p for p in profits if p <= 0]
-    sample_size = len(window)
-    win_rate = len(wins) / sample_size if sample_size else 0.0
-
-    if wins and losses:
-        avg_win = sum(wins) / len(wins)
-        avg_loss = abs(sum(losses) / len(losses))
-        break_even = avg_loss / (avg_win + avg_loss) if (avg_win + avg_loss) else 1.0
-    elif wins and not losses:
-        break_even = 0.0
-    else:
-        break_even = 1.0
 
-    return {
-        "sample_size": sample_size,
-        "win_rate": win_rate,
-        "break_even_win_rate": break_even,
-    }
+def sleep_until_next_tick(tick_start):
+    """Flush queued trades, then sleep out the poll interval begun at tick_start (monotonic).
+
+    A WAKE_SIGNAL received during the tick or the wait starts the next tick now.
+    """
+    try:
+        flush_trades()
+    except OSError as e:
+        print(f"  [CSV write error: {e}]")  # Rows stay queued for the next flush
+    remaining = max(0.0, tick_start + POLL_SECONDS - time.monotonic())
+    if WAKE_SIGNAL is None:
+        time.sleep(remaining)
+    else:
+        signal.sigtimedwait([WAKE_SIGNAL], remaining)
 
 
 def main():
@@ -239,19 +528,34 @@ def main():
         f"rolling window={CONSENSUS_ROLLING_WINDOW} | fee={CONSENSUS_FEE_PCT*100:.2f}%"
     )
 
+    if WAKE_SIGNAL is not None:
+        # Keep WAKE_SIGNAL pending until sigtimedwait collects it; HTTP_POOL
+        # threads start later and inherit the mask
+        signal.pthread_sigmask(signal.SIG_BLOCK, [WAKE_SIGNAL])
+
     current_ticker = None
     pending_previous = None
     trades = load_trades()
+    # Set while TRADES_CSV lacks in-memory settlements because a rewrite failed;
+    # the rewrite is retried each tick and no snapshot is taken meanwhile
+    csv_stale = False
 
     # Track which (strategy, buy_ticker) combos we've already traded
     traded_keys = {
-        (t.get("strategy", ""), t.get("buy_ticker", ""))
-        for t in trades if t.get("buy_ticker")
+        (t.strategy, t.buy_ticker)
+        for t in trades if t.buy_ticker
     }
 
+    # Unsettled trades grouped by buy_ticker; a ticker is dropped once all its trades settle
+    pending_by_ticker = defaultdict(list)
+    for t in trades:
+        if not t.outcome and t.buy_ticker:
+            pending_by_ticker[t.buy_ticker].append(t)
+
     # BTC price history: enough for the longest momentum window
     btc_history_len = max(100, int(MOMENTUM_15_WINDOW_SECONDS / max(POLL_SECONDS, 1)) + 20)
     btc_prices = deque(maxlen=btc_history_len)
+    btc_times = deque(maxlen=btc_history_len)  # Timestamps of btc_prices, for bisect
 
     # Track signals per market for consensus
     # signals[ticker] = {
@@ -262,15 +566,24 @@ def main():
     signals = {}
     arb_positions = {}
 
+    # Per-strategy stats, updated as trades are added and settled
+    stats_cache = build_stats_cache(trades)
+
+    # Settled consensus trades, extended as consensus trades settle
+    settled_cons = settled_consensus(trades)
+    cons_rolling = RollingConsensus(CONSENSUS_ROLLING_WINDOW)
+    for t in settled_cons:
+        cons_rolling.push(t.profit_usd or 0.0)
+
     # Print initial stats
-    prev_stats = calc_stats(trades, "PREVIOUS")
-    mom_stats = calc_stats(trades, "MOMENTUM")
-    cons_stats = calc_stats(trades, "CONSENSUS")
-    mom15_stats = calc_stats(trades, "MOMENTUM_15")
-    prev2_stats = calc_stats(trades, "PREVIOUS_2")
-    cons2_stats = calc_stats(trades, "CONSENSUS_2")
-    arb_stats = calc_stats(trades, "ARBITRAGE")
-    arb_hedge_stats = calc_stats(trades, "ARBITRAGE_HEDGE")
+    prev_stats = stats_cache["PREVIOUS"]
+    mom_stats = stats_cache["MOMENTUM"]
+    cons_stats = stats_cache["CONSENSUS"]
+    mom15_stats = stats_cache["MOMENTUM_15"]
+    prev2_stats = stats_cache["PREVIOUS_2"]
+    cons2_stats = stats_cache["CONSENSUS_2"]
+    arb_stats = stats_cache["ARBITRAGE"]
+    arb_hedge_stats = stats_cache["ARBITRAGE_HEDGE"]
     print(f"Loaded {len(trades)} trades")
     print(f"  PREVIOUS:  ${prev_stats['total_profit']:+.2f} ({prev_stats['wins']}W/{prev_stats['losses']}L)")
     print(f"  MOMENTUM:  ${mom_stats['total_profit']:+.2f} ({mom_stats['wins']}W/{mom_stats['losses']}L)")
@@ -282,35 +595,51 @@ def main():
           f"({arb_stats['wins'] + arb_hedge_stats['wins']}W/{arb_stats['losses'] + arb_hedge_stats['losses']}L)")
 
     while True:
+        tick_start = time.monotonic()
         try:
             now = datetime.now(timezone.utc)
+            now_iso = now.isoformat()  # Shared by every trade recorded this tick
+
+            # Fetch BTC price, the open market and pending settlements concurrently
+            # Trades on one ticker share its close time, so check the first
+            pending_tickers = [
+                buy_ticker for buy_ticker, pending in pending_by_ticker.items()
+                if not awaiting_close(pending[0], now)
+            ]
+            btc_future = HTTP_POOL.submit(get_btc_price)
+            market_future = HTTP_POOL.submit(get_open_market)
+            settle_future = HTTP_POOL.submit(get_markets_bulk, pending_tickers) if pending_tickers else None
 
             # Get BTC price
             try:
-                btc_price = get_btc_price()
+                btc_price = btc_future.result()
                 btc_prices.append((now, btc_price))
+                btc_times.append(now)
             except Exception as e:
                 btc_price = None
                 print(f"  [BTC price error: {e}]")
 
-            market = get_open_market()
+            market, close_time = market_future.result()
 
             if not market:
-                print(f"[{now.isoformat()}] No open KXBTC15M market found")
-                time.sleep(POLL_SECONDS)
+                print(f"[{now_iso}] No open KXBTC15M market found")
+                sleep_until_next_tick(tick_start)
                 continue
 
             ticker = market["ticker"]
             yes_ask = market.get("yes_ask", 0) / 100
             no_ask = market.get("no_ask", 0) / 100
+            # Per-side ask and $STAKE_USD contract count, shared by every strategy
+            ask = {"yes": yes_ask, "no": no_ask}
+            contracts_at = {side: STAKE_USD / p if p > 0 else 0 for side, p in ask.items()}
 
-            close_time_str = market.get("close_time", "")
-            close_time = datetime.fromisoformat(close_time_str.replace("Z", "+00:00")) if close_time_str else None
             time_to_close = (close_time - now).total_seconds() if close_time else None
+            close_time_iso = close_time.isoformat() if close_time else ""
 
             # Initialize signals for this ticker
-            if ticker not in signals:
-                signals[ticker] = {"PREVIOUS": None, "MOMENTUM": None, "MOMENTUM_15": None}
+            sig = signals.get(ticker)
+            if sig is None:
+                sig = signals[ticker] = {"PREVIOUS": None, "MOMENTUM": None, "MOMENTUM_15": None}
 
             # Detect market change
             if current_ticker is None:
@@ -319,55 +648,76 @@ def main():
                 pending_previous = current_ticker
                 current_ticker = ticker
 
-            # Check pending trades for settlement
-            updated = False
-            for trade in trades:
-                if trade.get("outcome"):
-                    continue
+            # Check pending trades for settlement against the bulk markets query
+            settle_markets = {}
+            if settle_future:
+                try:
+                    settle_markets = settle_future.result()
+                except Exception:
+                    pass
 
-                buy_ticker = trade.get("buy_ticker")
-                if not buy_ticker:
+            updated = False
+            for buy_ticker in pending_tickers:
+                m = settle_markets.get(buy_ticker)
+                if not m:
                     continue
-
                 try:
-                    m = get_market(buy_ticker)
                     result = get_settled_side(m)
-                    if result:
-                        buy_side = trade.get("buy_side")
-                        contracts = float(trade.get("contracts", 0))
-                        stake = float(trade.get("stake_usd", 0))
+                except Exception:
+                    continue
+                if not result:
+                    continue
+
+                unsettled = []  # Trades that failed to settle stay pending for a retry
+                for trade in pending_by_ticker.pop(buy_ticker, ()):
+                    try:
+                        buy_side = trade.buy_side
+                        contracts = float(trade.contracts)
+                        stake = float(trade.stake_usd)
 
                         won = (result == buy_side)
                         payout = contracts if won else 0
                         gross_profit = payout - stake
-                        fee = stake * CONSENSUS_FEE_PCT if trade.get("strategy") in ("CONSENSUS", "CONSENSUS_2") else 0.0
+                        is_consensus = trade.strategy in CONSENSUS_STRATEGIES
+                        fee = stake * CONSENSUS_FEE_PCT if is_consensus else 0.0
                         profit = gross_profit - fee
 
-                        trade["outcome"] = "WIN" if won else "LOSS"
-                        trade["payout_usd"] = round(payout, 4)
-                        trade["gross_profit_usd"] = round(gross_profit, 4)
-                        trade["fee_usd"] = round(fee, 4)
-                        trade["profit_usd"] = round(profit, 4)
+                        trade.outcome = "WIN" if won else "LOSS"
+                        trade.payout_usd = round(payout, 4)
+                        trade.gross_profit_usd = round(gross_profit, 4)
+                        trade.fee_usd = round(fee, 4)
+                        trade.profit_usd = round(profit, 4)
+                        stats_settle(stats_cache, trade)
+                        if is_consensus:
+                            settled_cons.append(trade)
+                            cons_rolling.push(trade.profit_usd)
                         updated = True
 
-                        strat = trade.get("strategy", "?")
-                        print(f"  ** [{strat}] SETTLED {buy_ticker}: {trade['outcome']} ${profit:+.2f}")
-                except Exception:
-                    pass
+                        print(f"  ** [{trade.strategy}] SETTLED {buy_ticker}: {trade.outcome} ${profit:+.2f}")
+                    except Exception:
+                        if not trade.outcome:
+                            unsettled.append(trade)
+                if unsettled:
+                    pending_by_ticker[buy_ticker] = unsettled
 
-            if updated:
+            if updated or csv_stale:
+                csv_stale = True
                 save_trades(trades)
+                csv_stale = False
 
             # Print status
-            prev_stats = calc_stats(trades, "PREVIOUS")
-            mom_stats = calc_stats(trades, "MOMENTUM")
-            cons_stats = calc_stats(trades, "CONSENSUS")
-            mom15_stats = calc_stats(trades, "MOMENTUM_15")
-            prev2_stats = calc_stats(trades, "PREVIOUS_2")
-            cons2_stats = calc_stats(trades, "CONSENSUS_2")
-            arb_stats = calc_stats(trades, "ARBITRAGE")
-            arb_hedge_stats = calc_stats(trades, "ARBITRAGE_HEDGE")
-            cons_bankroll = consensus_bankroll(trades)
+            prev_stats = stats_cache["PREVIOUS"]
+            mom_stats = stats_cache["MOMENTUM"]
+            cons_stats = stats_cache["CONSENSUS"]
+            mom15_stats = stats_cache["MOMENTUM_15"]
+            prev2_stats = stats_cache["PREVIOUS_2"]
+            cons2_stats = stats_cache["CONSENSUS_2"]
+            arb_stats = stats_cache["ARBITRAGE"]
+            arb_hedge_stats = stats_cache["ARBITRAGE_HEDGE"]
+            # Consensus risk inputs only change on settlement, which happened
+            # above, so both consensus strategies share them for this tick.
+            cons_bankroll = consensus_bankroll(settled_cons)
+            cons_period_pnl = None  # (day, week), computed on first use
             btc_str = f"BTC=${btc_price:,.0f}" if btc_price else "BTC=?"
             time_str = f"{time_to_close:.0f}s" if time_to_close else "?"
             print(
@@ -381,32 +731,33 @@ def main():
 
             # === STRATEGY 1: PREVIOUS RESULT ===
             if pending_previous and ("PREVIOUS", ticker) not in traded_keys:
-                prev_market = get_market(pending_previous)
+                # Usually already fetched by this tick's settlement query
+                prev_market = settle_markets.get(pending_previous) or get_market(pending_previous)
                 settled = get_settled_side(prev_market)
 
                 if settled:
                     # Record signal
-                    signals[ticker]["PREVIOUS"] = settled
-
-                    price = yes_ask if settled == "yes" else no_ask
-                    contracts = STAKE_USD / price if price > 0 else 0
-
-                    trade = {
-                        "time": now.isoformat(),
-                        "strategy": "PREVIOUS",
-                        "previous_ticker": pending_previous,
-                        "previous_result": settled,
-                        "buy_ticker": ticker,
-                        "buy_side": settled,
-                        "stake_usd": STAKE_USD,
-                        "price_usd": round(price, 4),
-                        "contracts": round(contracts, 4),
-                        "outcome": "",
-                        "payout_usd": "",
-                        "profit_usd": "",
-                    }
+                    sig["PREVIOUS"] = settled
+
+                    price = ask[settled]
+                    contracts = contracts_at[settled]
+
+                    trade = Trade(
+                        time=now_iso,
+                        strategy="PREVIOUS",
+                        previous_ticker=pending_previous,
+                        previous_result=settled,
+                        buy_ticker=ticker,
+                        close_time=close_time_iso,
+                        buy_side=settled,
+                        stake_usd=STAKE_USD,
+                        price_usd=round(price, 4),
+                        contracts=round(contracts, 4),
+                    )
                     trades.append(trade)
-                    save_trades(trades)
+                    append_trade(trade)
+                    stats_add(stats_cache, trade)
+                    pending_by_ticker[ticker].append(trade)
                     traded_keys.add(("PREVIOUS", ticker))
 
                     print(f"  -> [PREVIOUS] BUY {settled} ${STAKE_USD} @ ${price:.4f}")
@@ -422,10 +773,9 @@ def main():
             ):
                 # Get price from ~60 seconds ago
                 cutoff = now - timedelta(seconds=MOMENTUM_WINDOW_SECONDS)
-                old_prices = [(t, p) for t, p in btc_prices if t <= cutoff]
+                old_price = price_at_or_before(btc_times, btc_prices, cutoff)
 
-                if old_prices:
-                    _, old_price = old_prices[-1]
+                if old_price is not None:
                     _, current_price = btc_prices[-1]
 
                     if current_price > old_price:
@@ -434,28 +784,28 @@ def main():
                         side = "no"   # Price falling, bet DOWN
 
                     # Record signal
-                    signals[ticker]["MOMENTUM"] = side
+                    sig["MOMENTUM"] = side
 
-                    price = yes_ask if side == "yes" else no_ask
-                    contracts = STAKE_USD / price if price > 0 else 0
+                    price = ask[side]
+                    contracts = contracts_at[side]
                     pct_change = ((current_price - old_price) / old_price) * 100
 
-                    trade = {
-                        "time": now.isoformat(),
-                        "strategy": "MOMENTUM",
-                        "previous_ticker": pending_previous,
-                        "previous_result": f"BTC {pct_change:+.3f}%",
-                        "buy_ticker": ticker,
-                        "buy_side": side,
-                        "stake_usd": STAKE_USD,
-                        "price_usd": round(price, 4),
-                        "contracts": round(contracts, 4),
-                        "outcome": "",
-                        "payout_usd": "",
-                        "profit_usd": "",
-                    }
+                    trade = Trade(
+                        time=now_iso,
+                        strategy="MOMENTUM",
+                        previous_ticker=pending_previous,
+                        previous_result=f"BTC {pct_change:+.3f}%",
+                        buy_ticker=ticker,
+                        close_time=close_time_iso,
+                        buy_side=side,
+                        stake_usd=STAKE_USD,
+                        price_usd=round(price, 4),
+                        contracts=round(contracts, 4),
+                    )
                     trades.append(trade)
-                    save_trades(trades)
+                    append_trade(trade)
+                    stats_add(stats_cache, trade)
+                    pending_by_ticker[ticker].append(trade)
                     traded_keys.add(("MOMENTUM", ticker))
 
                     direction = "UP" if side == "yes" else "DOWN"
@@ -468,35 +818,34 @@ def main():
                 and len(btc_prices) >= 2
             ):
                 cutoff = now - timedelta(seconds=MOMENTUM_15_WINDOW_SECONDS)
-                old_prices = [(t, p) for t, p in btc_prices if t <= cutoff]
+                old_price = price_at_or_before(btc_times, btc_prices, cutoff)
 
-                if old_prices:
-                    _, old_price = old_prices[-1]
+                if old_price is not None:
                     _, current_price = btc_prices[-1]
                     side = "yes" if current_price > old_price else "no"
 
-                    signals[ticker]["MOMENTUM_15"] = side
+                    sig["MOMENTUM_15"] = side
 
-                    price = yes_ask if side == "yes" else no_ask
-                    contracts = STAKE_USD / price if price > 0 else 0
+                    price = ask[side]
+                    contracts = contracts_at[side]
                     pct_change = ((current_price - old_price) / old_price) * 100
 
-                    trade = {
-                        "time": now.isoformat(),
-                        "strategy": "MOMENTUM_15",
-                        "previous_ticker": pending_previous,
-                        "previous_result": f"BTC15 {pct_change:+.3f}%",
-                        "buy_ticker": ticker,
-                        "buy_side": side,
-                        "stake_usd": STAKE_USD,
-                        "price_usd": round(price, 4),
-                        "contracts": round(contracts, 4),
-                        "outcome": "",
-                        "payout_usd": "",
-                        "profit_usd": "",
-                    }
+                    trade = Trade(
+                        time=now_iso,
+                        strategy="MOMENTUM_15",
+                        previous_ticker=pending_previous,
+                        previous_result=f"BTC15 {pct_change:+.3f}%",
+                        buy_ticker=ticker,
+                        close_time=close_time_iso,
+                        buy_side=side,
+                        stake_usd=STAKE_USD,
+                        price_usd=round(price, 4),
+                        contracts=round(contracts, 4),
+                    )
                     trades.append(trade)
-                    save_trades(trades)
+                    append_trade(trade)
+                    stats_add(stats_cache, trade)
+                    pending_by_ticker[ticker].append(trade)
                     traded_keys.add(("MOMENTUM_15", ticker))
                     direction = "UP" if side == "yes" else "DOWN"
                     print(f"  -> [MOMENTUM_15] BTC {pct_change:+.3f}% -> BUY {side} ({direction}) ${STAKE_USD} @ ${price:.4f}")
@@ -504,17 +853,17 @@ def main():
             # === STRATEGY 3: CONSENSUS ===
             # Only bet if both PREVIOUS and MOMENTUM agree, and we haven't traded yet
             if ("CONSENSUS", ticker) not in traded_keys:
-                prev_signal = signals[ticker].get("PREVIOUS")
-                mom_signal = signals[ticker].get("MOMENTUM")
+                prev_signal = sig["PREVIOUS"]
+                mom_signal = sig["MOMENTUM"]
 
                 if prev_signal and mom_signal and prev_signal == mom_signal:
                     side = prev_signal  # Both agree
 
-                    price = yes_ask if side == "yes" else no_ask
+                    price = ask[side]
                     if price <= 0:
                         traded_keys.add(("CONSENSUS", ticker))
                         print(f"  -> [CONSENSUS] Skip - invalid price ({price})")
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
                     if price > CONSENSUS_MAX_PRICE:
@@ -522,36 +871,38 @@ def main():
                         print(
                             f"  -> [CONSENSUS] Skip - ask ${price:.4f} > max ${CONSENSUS_MAX_PRICE:.2f}"
                         )
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
-                    bankroll = consensus_bankroll(trades)
+                    bankroll = cons_bankroll
                     if bankroll <= 0:
                         traded_keys.add(("CONSENSUS", ticker))
                         print("  -> [CONSENSUS] Skip - bankroll depleted")
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
                     r_value = max(bankroll * CONSENSUS_RISK_PCT, 0.01)
                     daily_cap = CONSENSUS_DAILY_LOSS_CAP_R * r_value
                     weekly_cap = CONSENSUS_WEEKLY_LOSS_CAP_R * r_value
-                    day_pnl, week_pnl = consensus_period_pnl(trades, now)
+                    if cons_period_pnl is None:
+                        cons_period_pnl = consensus_period_pnl(settled_cons, now)
+                    day_pnl, week_pnl = cons_period_pnl
                     if day_pnl <= -daily_cap:
                         traded_keys.add(("CONSENSUS", ticker))
                         print(
                             f"  -> [CONSENSUS] Skip - daily loss cap hit ({day_pnl:+.2f} <= -{daily_cap:.2f})"
                         )
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
                     if week_pnl <= -weekly_cap:
                         traded_keys.add(("CONSENSUS", ticker))
                         print(
                             f"  -> [CONSENSUS] Skip - weekly loss cap hit ({week_pnl:+.2f} <= -{weekly_cap:.2f})"
                         )
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
-                    rolling = rolling_consensus_metrics(trades)
+                    rolling = cons_rolling.metrics()
                     if (
                         rolling["sample_size"] >= CONSENSUS_ROLLING_WINDOW
                         and rolling["win_rate"] < rolling["break_even_win_rate"]
@@ -561,7 +912,7 @@ def main():
                             "  -> [CONSENSUS] Skip - rolling win rate below break-even "
                             f"({rolling['win_rate']*100:.1f}% < {rolling['break_even_win_rate']*100:.1f}%)"
                         )
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
                     target_stake = bankroll * CONSENSUS_RISK_PCT
@@ -573,7 +924,7 @@ def main():
                         print(
                             f"  -> [CONSENSUS] Skip - stake ${stake:.2f} too small for ask ${price:.4f}"
                         )
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
                     max_contracts = int(max_stake / price)
@@ -581,29 +932,27 @@ def main():
                     if contracts < 1:
                         traded_keys.add(("CONSENSUS", ticker))
                         print("  -> [CONSENSUS] Skip - exceeds max risk per trade")
-                        time.sleep(POLL_SECONDS)
+                        sleep_until_next_tick(tick_start)
                         continue
 
                     stake = contracts * price
 
-                    trade = {
-                        "time": now.isoformat(),
-                        "strategy": "CONSENSUS",
-                        "previous_ticker": "",
-                        "previous_result": f"PREV={prev_signal} MOM={mom_signal}",
-                        "buy_ticker": ticker,
-                        "buy_side": side,
-                        "stake_usd": round(stake, 4),
-                        "price_usd": round(price, 4),
-                        "contracts": contracts,
-                        "fee_usd": "",
-                        "gross_profit_usd": "",
-                        "outcome": "",
-                        "payout_usd": "",
-                        "profit_usd": "",
-                    }
+                    trade = Trade(
+                        time=now_iso,
+                        strategy="CONSENSUS",
+                        previous_ticker="",
+                        previous_result=f"PREV={prev_signal} MOM={mom_signal}",
+                        buy_ticker=ticker,
+                        close_time=close_time_iso,
+                        buy_side=side,
+                        stake_usd=round(stake, 4),
+                        price_usd=round(price, 4),
+                        contracts=contracts,
+                    )
                     trades.append(trade)
-                    save_trades(trades)
+                    append_trade(trade)
+                    stats_add(stats_cache, trade)
+                    pending_by_ticker[ticker].append(trade)
                     traded_keys.add(("CONSENSUS", ticker))
 
                     direction = "UP" if side == "yes" else "DOWN"
@@ -618,58 +967,60 @@ def main():
 
             # === STRATEGY 4: PREVIOUS_2 ===
             if ("PREVIOUS_2", ticker) not in traded_keys:
-                prev_signal = signals[ticker].get("PREVIOUS")
+                prev_signal = sig["PREVIOUS"]
                 if prev_signal:
-                    price = yes_ask if prev_signal == "yes" else no_ask
+                    price = ask[prev_signal]
                     if 0 < price <= DEAL_MAX_PRICE:
-                        contracts = STAKE_USD / price
-                        trade = {
-                            "time": now.isoformat(),
-                            "strategy": "PREVIOUS_2",
-                            "previous_ticker": pending_previous or "",
-                            "previous_result": prev_signal,
-                            "buy_ticker": ticker,
-                            "buy_side": prev_signal,
-                            "stake_usd": STAKE_USD,
-                            "price_usd": round(price, 4),
-                            "contracts": round(contracts, 4),
-                            "outcome": "",
-                            "payout_usd": "",
-                            "profit_usd": "",
-                        }
+                        contracts = contracts_at[prev_signal]
+                        trade = Trade(
+                            time=now_iso,
+                            strategy="PREVIOUS_2",
+                            previous_ticker=pending_previous or "",
+                            previous_result=prev_signal,
+                            buy_ticker=ticker,
+                            close_time=close_time_iso,
+                            buy_side=prev_signal,
+                            stake_usd=STAKE_USD,
+                            price_usd=round(price, 4),
+                            contracts=round(contracts, 4),
+                        )
                         trades.append(trade)
-                        save_trades(trades)
+                        append_trade(trade)
+                        stats_add(stats_cache, trade)
+                        pending_by_ticker[ticker].append(trade)
                         traded_keys.add(("PREVIOUS_2", ticker))
                         print(f"  -> [PREVIOUS_2] BUY {prev_signal} ${STAKE_USD} @ ${price:.4f}")
 
             # === STRATEGY 5: CONSENSUS_2 ===
             if ("CONSENSUS_2", ticker) not in traded_keys:
-                prev_signal = signals[ticker].get("PREVIOUS")
-                mom_signal = signals[ticker].get("MOMENTUM")
+                prev_signal = sig["PREVIOUS"]
+                mom_signal = sig["MOMENTUM"]
                 if prev_signal and mom_signal and prev_signal == mom_signal:
                     side = prev_signal
-                    price = yes_ask if side == "yes" else no_ask
+                    price = ask[side]
                     if 0 < price <= DEAL_MAX_PRICE:
-                        bankroll = consensus_bankroll(trades)
+                        bankroll = cons_bankroll
                         if bankroll > 0:
                             r_value = max(bankroll * CONSENSUS_RISK_PCT, 0.01)
                             daily_cap = CONSENSUS_DAILY_LOSS_CAP_R * r_value
                             weekly_cap = CONSENSUS_WEEKLY_LOSS_CAP_R * r_value
-                            day_pnl, week_pnl = consensus_period_pnl(trades, now)
+                            if cons_period_pnl is None:
+                                cons_period_pnl = consensus_period_pnl(settled_cons, now)
+                            day_pnl, week_pnl = cons_period_pnl
                             if day_pnl <= -daily_cap:
                                 print(
                                     f"  -> [CONSENSUS_2] Waiting - daily loss cap hit ({day_pnl:+.2f} <= -{daily_cap:.2f})"
                                 )
-                                time.sleep(POLL_SECONDS)
+                                sleep_until_next_tick(tick_start)
                                 continue
                             if week_pnl <= -weekly_cap:
                                 print(
                                     f"  -> [CONSENSUS_2] Waiting - weekly loss cap hit ({week_pnl:+.2f} <= -{weekly_cap:.2f})"
                                 )
-                                time.sleep(POLL_SECONDS)
+                                sleep_until_next_tick(tick_start)
                                 continue
 
-                            rolling = rolling_consensus_metrics(trades)
+                            rolling = cons_rolling.metrics()
                             if (
                                 rolling["sample_size"] >= CONSENSUS_ROLLING_WINDOW
                                 and rolling["win_rate"] < rolling["break_even_win_rate"]
@@ -678,7 +1029,7 @@ def main():
                                     "  -> [CONSENSUS_2] Waiting - rolling win rate below break-even "
                                     f"({rolling['win_rate']*100:.1f}% < {rolling['break_even_win_rate']*100:.1f}%)"
                                 )
-                                time.sleep(POLL_SECONDS)
+                                sleep_until_next_tick(tick_start)
                                 continue
 
                             target_stake = bankroll * CONSENSUS_RISK_PCT
@@ -689,24 +1040,22 @@ def main():
                             contracts = min(contracts, max_contracts) if max_contracts > 0 else contracts
                             if contracts >= 1:
                                 stake = contracts * price
-                                trade = {
-                                    "time": now.isoformat(),
-                                    "strategy": "CONSENSUS_2",
-                                    "previous_ticker": "",
-                                    "previous_result": f"PREV={prev_signal} MOM={mom_signal}",
-                                    "buy_ticker": ticker,
-                                    "buy_side": side,
-                                    "stake_usd": round(stake, 4),
-                                    "price_usd": round(price, 4),
-                                    "contracts": contracts,
-                                    "fee_usd": "",
-                                    "gross_profit_usd": "",
-                                    "outcome": "",
-                                    "payout_usd": "",
-                                    "profit_usd": "",
-                                }
+                                trade = Trade(
+                                    time=now_iso,
+                                    strategy="CONSENSUS_2",
+                                    previous_ticker="",
+                                    previous_result=f"PREV={prev_signal} MOM={mom_signal}",
+                                    buy_ticker=ticker,
+                                    close_time=close_time_iso,
+                                    buy_side=side,
+                                    stake_usd=round(stake, 4),
+                                    price_usd=round(price, 4),
+                                    contracts=contracts,
+                                )
                                 trades.append(trade)
-                                save_trades(trades)
+                                append_trade(trade)
+                                stats_add(stats_cache, trade)
+                                pending_by_ticker[ticker].append(trade)
                                 traded_keys.add(("CONSENSUS_2", ticker))
                                 print(
                                     f"  -> [CONSENSUS_2] Both agree {side} -> BUY {contracts} (${stake:.2f}) @ ${price:.4f}"
@@ -719,24 +1068,24 @@ def main():
             if ("ARBITRAGE", ticker) not in traded_keys:
                 if yes_ask > 0 and no_ask > 0:
                     first_side = "yes" if yes_ask <= no_ask else "no"
-                    first_price = yes_ask if first_side == "yes" else no_ask
-                    contracts = STAKE_USD / first_price if first_price > 0 else 0
-                    trade = {
-                        "time": now.isoformat(),
-                        "strategy": "ARBITRAGE",
-                        "previous_ticker": "",
-                        "previous_result": "first_leg",
-                        "buy_ticker": ticker,
-                        "buy_side": first_side,
-                        "stake_usd": STAKE_USD,
-                        "price_usd": round(first_price, 4),
-                        "contracts": round(contracts, 4),
-                        "outcome": "",
-                        "payout_usd": "",
-                        "profit_usd": "",
-                    }
+                    first_price = ask[first_side]
+                    contracts = contracts_at[first_side]
+                    trade = Trade(
+                        time=now_iso,
+                        strategy="ARBITRAGE",
+                        previous_ticker="",
+                        previous_result="first_leg",
+                        buy_ticker=ticker,
+                        close_time=close_time_iso,
+                        buy_side=first_side,
+                        stake_usd=STAKE_USD,
+                        price_usd=round(first_price, 4),
+                        contracts=round(contracts, 4),
+                    )
                     trades.append(trade)
-                    save_trades(trades)
+                    append_trade(trade)
+                    stats_add(stats_cache, trade)
+                    pending_by_ticker[ticker].append(trade)
                     traded_keys.add(("ARBITRAGE", ticker))
                     arb_positions[ticker] = {
                         "side": first_side,
@@ -751,29 +1100,29 @@ def main():
                 pos = arb_positions[ticker]
                 if not pos["hedged"]:
                     opposite_side = "no" if pos["side"] == "yes" else "yes"
-                    opposite_price = no_ask if opposite_side == "no" else yes_ask
+                    opposite_price = ask[opposite_side]
                     edge = 1.0 - (pos["price"] + opposite_price)
                     if opposite_price > 0 and edge > 0:
                         max_contracts_by_bet = int((ARBITRAGE_MAX_BET_USD - 0.0001) / opposite_price)
                         hedge_contracts = min(int(pos["contracts"]), max_contracts_by_bet)
                         if hedge_contracts >= 1:
                             hedge_stake = hedge_contracts * opposite_price
-                            trade = {
-                                "time": now.isoformat(),
-                                "strategy": "ARBITRAGE_HEDGE",
-                                "previous_ticker": "",
-                                "previous_result": f"hedge_of={pos['side']} edge={edge:.4f}",
-                                "buy_ticker": ticker,
-                                "buy_side": opposite_side,
-                                "stake_usd": round(hedge_stake, 4),
-                                "price_usd": round(opposite_price, 4),
-                                "contracts": hedge_contracts,
-                                "outcome": "",
-                                "payout_usd": "",
-                                "profit_usd": "",
-                            }
+                            trade = Trade(
+                                time=now_iso,
+                                strategy="ARBITRAGE_HEDGE",
+                                previous_ticker="",
+                                previous_result=f"hedge_of={pos['side']} edge={edge:.4f}",
+                                buy_ticker=ticker,
+                                close_time=close_time_iso,
+                                buy_side=opposite_side,
+                                stake_usd=round(hedge_stake, 4),
+                                price_usd=round(opposite_price, 4),
+                                contracts=hedge_contracts,
+                            )
                             trades.append(trade)
-                            save_trades(trades)
+                            append_trade(trade)
+                            stats_add(stats_cache, trade)
+                            pending_by_ticker[ticker].append(trade)
                             traded_keys.add(("ARBITRAGE_HEDGE", ticker))
                             pos["hedged"] = True
                             guaranteed = hedge_contracts * edge
@@ -786,19 +1135,27 @@ def main():
             if pending_previous and ("PREVIOUS", ticker) in traded_keys and ("MOMENTUM", ticker) in traded_keys:
                 pending_previous = None
 
-            time.sleep(POLL_SECONDS)
+            sleep_until_next_tick(tick_start)
 
         except KeyboardInterrupt:
             print("\nStopped.")
-            prev_stats = calc_stats(trades, "PREVIOUS")
-            mom_stats = calc_stats(trades, "MOMENTUM")
-            cons_stats = calc_stats(trades, "CONSENSUS")
-            mom15_stats = calc_stats(trades, "MOMENTUM_15")
-            prev2_stats = calc_stats(trades, "PREVIOUS_2")
-            cons2_stats = calc_stats(trades, "CONSENSUS_2")
-            arb_stats = calc_stats(trades, "ARBITRAGE")
-            arb_hedge_stats = calc_stats(trades, "ARBITRAGE_HEDGE")
-            total_stats = calc_stats(trades)
+            try:
+                flush_trades()
+            except OSError as e:
+                print(f"  [CSV write error: {e}]")
+            else:
+                # Only snapshot trades the CSV on disk fully reflects
+                if not csv_stale:
+                    save_snapshot(trades)
+            prev_stats = stats_cache["PREVIOUS"]
+            mom_stats = stats_cache["MOMENTUM"]
+            cons_stats = stats_cache["CONSENSUS"]
+            mom15_stats = stats_cache["MOMENTUM_15"]
+            prev2_stats = stats_cache["PREVIOUS_2"]
+            cons2_stats = stats_cache["CONSENSUS_2"]
+            arb_stats = stats_cache["ARBITRAGE"]
+            arb_hedge_stats = stats_cache["ARBITRAGE_HEDGE"]
+            total_stats = combined_stats(stats_cache)
             print(f"=== FINAL STATS ===")
             print(f"PREVIOUS:  ${prev_stats['total_profit']:+.2f} | {prev_stats['wins']}W/{prev_stats['losses']}L | {prev_stats['pending']} pending")
             print(f"MOMENTUM:  ${mom_stats['total_profit']:+.2f} | {mom_stats['wins']}W/{mom_stats['losses']}L | {mom_stats['pending']} pending")
@@ -816,7 +1173,7 @@ def main():
             break
         except Exception as e:
             print(f"Error: {e}")
-            time.sleep(POLL_SECONDS)
+            sleep_until_next_tick(tick_start)
 
 
 if __name__ == "__main__":
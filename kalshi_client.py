@@ -48,21 +48,20 @@ class KalshiClient:
             raise ValueError("KALSHI_API_KEY_ID environment variable required")
 
         self.private_key = load_private_key()
+        # Signing parameters are the same for every request
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH,
+        )
+        self._sha256 = hashes.SHA256()
         self.session = requests.Session()
 
     def _sign_request(self, method: str, path: str, timestamp: str) -> str:
         """Generate RSA-PSS signature for request."""
-        path_without_query = path.split("?")[0]
-        message = f"{timestamp}{method}/trade-api/v2{path_without_query}"
-        signature = self.private_key.sign(
-            message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
-        return base64.b64encode(signature).decode("utf-8")
+        path_without_query = path.split("?", 1)[0]
+        message = f"{timestamp}{method}/trade-api/v2{path_without_query}".encode()
+        signature = self.private_key.sign(message, self._pss, self._sha256)
+        return base64.b64encode(signature).decode("ascii")
 
     def _request(self, method: str, path: str, **kwargs):
         """Make authenticated request to Kalshi API."""
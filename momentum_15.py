@@ -14,13 +14,18 @@ Requires environment variables:
 import base64
 import csv
 import os
+import sys
 import time
 import uuid
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from dotenv import load_dotenv
@@ -31,6 +36,26 @@ POLL_SECONDS = int(os.getenv("POLL_SECONDS", "5"))
 STAKE_USD = float(os.getenv("STAKE_USD", "5.0"))
 MOMENTUM_15_WINDOW_SECONDS = int(os.getenv("MOMENTUM_15_WINDOW_SECONDS", "900"))
 TRADES_CSV = Path(os.getenv("MOMENTUM_15_TRADES_CSV", "data/momentum_15_trades.csv"))
+MARKETS_BULK_MAX = 100  # Tickers per bulk /markets request
+TRADE_FIELDNAMES = [
+    "time",
+    "strategy",
+    "previous_ticker",
+    "previous_result",
+    "buy_ticker",
+    "buy_side",
+    "stake_usd",
+    "price_usd",
+    "contracts",
+    "order_id",
+    "outcome",
+    "payout_usd",
+    "profit_usd",
+]
+
+
+# Runs a tick's independent API requests concurrently over the client's session
+HTTP_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="http")
 
 
 def get_api_base():
@@ -63,21 +88,22 @@ class KalshiClient:
             raise ValueError("KALSHI_API_KEY_ID environment variable required")
 
         self.private_key = load_private_key()
+        # Signing parameters are the same for every request
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH,
+        )
+        self._sha256 = hashes.SHA256()
+        # Kept alive across polls; also used for the Coinbase price feed
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
     def _sign_request(self, method: str, path: str, timestamp: str) -> str:
         """Generate RSA-PSS signature for request."""
-        path_without_query = path.split("?")[0]
-        message = f"{timestamp}{method}/trade-api/v2{path_without_query}"
-        signature = self.private_key.sign(
-            message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
-        return base64.b64encode(signature).decode("utf-8")
+        path_without_query = path.split("?", 1)[0]
+        message = f"{timestamp}{method}/trade-api/v2{path_without_query}".encode()
+        signature = self.private_key.sign(message, self._pss, self._sha256)
+        return base64.b64encode(signature).decode("ascii")
 
     def _request(self, method: str, path: str, **kwargs):
         """Make authenticated request to Kalshi API."""
@@ -112,6 +138,18 @@ class KalshiClient:
         resp = self._request("GET", f"/markets/{ticker}", timeout=20)
         return resp.get("market", {})
 
+    def get_markets_by_tickers(self, tickers):
+        """Get several markets by ticker, returned as a dict of ticker -> market."""
+        tickers = list(tickers)
+        markets = {}
+        for i in range(0, len(tickers), MARKETS_BULK_MAX):
+            chunk = tickers[i:i + MARKETS_BULK_MAX]
+            params = {"tickers": ",".join(chunk), "limit": len(chunk)}
+            resp = self._request("GET", "/markets", params=params, timeout=20)
+            for market in resp.get("markets", []):
+                markets[market.get("ticker")] = market
+        return markets
+
     def place_order(self, ticker, side, contracts, price_cents, dry_run=False):
         """
         Place a limit order.
@@ -154,9 +192,9 @@ class KalshiClient:
         return self._request("POST", "/portfolio/orders", json=order, timeout=30)
 
 
-def get_btc_price():
-    """Get current BTC price from Coinbase."""
-    resp = requests.get(
+def get_btc_price(session=requests):
+    """Get current BTC price from Coinbase, over session's pooled connections if given."""
+    resp = session.get(
         "https://api.coinbase.com/v2/prices/BTC-USD/spot",
         timeout=10,
     )
@@ -164,27 +202,41 @@ def get_btc_price():
     return float(resp.json()["data"]["amount"])
 
 
+@lru_cache(maxsize=1024)
+def parse_close_time(value):
+    """Parse an API close_time such as "2026-01-05T00:15:00Z".
+
+    Memoized because the same open markets come back on every poll.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def get_open_market(client):
     """Get the next expiring open market."""
     markets = client.get_markets(SERIES_TICKER, status="open")
     now = datetime.now(timezone.utc)
-    candidates = []
+    best = None
+    best_exp = None
 
     for market in markets:
         close_time = market.get("close_time")
         if not close_time:
             continue
-        exp = datetime.fromisoformat(close_time.replace("Z", "+00:00"))
-        if exp > now:
-            candidates.append((exp, market))
-
-    if not candidates:
-        return None
+        exp = parse_close_time(close_time)
+        if exp > now and (best_exp is None or exp < best_exp):
+            best, best_exp = market, exp
 
-    _, best = min(candidates, key=lambda x: x[0])
     return best
 
 
+def price_at_or_before(btc_times, btc_prices, cutoff):
+    """Return the latest BTC price sampled at or before cutoff, or None."""
+    idx = bisect_right(btc_times, cutoff) - 1
+    if idx < 0:
+        return None
+    return btc_prices[idx][1]
+
+
 def get_settled_side(market):
     """Return 'yes' or 'no' if market is settled, else None."""
     result = market.get("result")
@@ -202,59 +254,70 @@ def load_trades():
 
 
 def save_trades(trades):
-    """Save trades to CSV."""
+    """Save trades to CSV, rewriting the file."""
     if not trades:
         return
     TRADES_CSV.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "time",
-        "strategy",
-        "previous_ticker",
-        "previous_result",
-        "buy_ticker",
-        "buy_side",
-        "stake_usd",
-        "price_usd",
-        "contracts",
-        "order_id",
-        "outcome",
-        "payout_usd",
-        "profit_usd",
-    ]
     with TRADES_CSV.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=TRADE_FIELDNAMES)
         writer.writeheader()
         writer.writerows(trades)
 
 
-def calc_stats(trades):
-    """Calculate P&L stats."""
-    total_staked = 0.0
-    total_profit = 0.0
-    wins = 0
-    losses = 0
-    pending = 0
+def append_trade(trade):
+    """Append a single new trade to CSV without rewriting existing rows."""
+    TRADES_CSV.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not TRADES_CSV.exists() or TRADES_CSV.stat().st_size == 0
+    with TRADES_CSV.open("a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TRADE_FIELDNAMES)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(trade)
 
+
+def calc_stats(trades):
+    """Calculate P&L stats; keep them current with stats_add/stats_settle."""
+    stats = {
+        "total_staked": 0.0,
+        "total_profit": 0.0,
+        "wins": 0,
+        "losses": 0,
+        "pending": 0,
+    }
     for t in trades:
-        total_staked += float(t.get("stake_usd", 0))
-        profit = t.get("profit_usd", "")
-        if profit != "":
-            p = float(profit)
-            total_profit += p
-            if p > 0:
-                wins += 1
-            else:
-                losses += 1
+        stats_add(stats, t)
+    return stats
+
+
+def stats_add(stats, trade):
+    """Account for a newly placed (or loaded) trade in stats."""
+    stats["total_staked"] += float(trade.get("stake_usd", 0))
+    profit = trade.get("profit_usd", "")
+    if profit != "":
+        p = float(profit)
+        stats["total_profit"] += p
+        if p > 0:
+            stats["wins"] += 1
         else:
-            pending += 1
-
-    return {
-        "total_staked": total_staked,
-        "total_profit": total_profit,
-        "wins": wins,
-        "losses": losses,
-        "pending": pending,
-    }
+            stats["losses"] += 1
+    else:
+        stats["pending"] += 1
+
+
+def stats_settle(stats, trade):
+    """Move a just-settled trade from pending to a win or loss in stats."""
+    p = float(trade["profit_usd"])
+    stats["pending"] -= 1
+    stats["total_profit"] += p
+    if p > 0:
+        stats["wins"] += 1
+    else:
+        stats["losses"] += 1
+
+
+def sleep_until_next_tick(tick_start):
+    """Sleep out the rest of the poll interval that began at tick_start (monotonic)."""
+    time.sleep(max(0.0, tick_start + POLL_SECONDS - time.monotonic()))
 
 
 def main():
@@ -301,6 +364,7 @@ def main():
         int(MOMENTUM_15_WINDOW_SECONDS / max(POLL_SECONDS, 1)) + 30,
     )
     btc_prices = deque(maxlen=btc_history_len)
+    btc_times = deque(maxlen=btc_history_len)  # Timestamps of btc_prices, for bisect
 
     stats = calc_stats(trades)
     print(f"Loaded {len(trades)} trades from CSV")
@@ -312,22 +376,39 @@ def main():
     print("Starting bot loop...")
     print("-" * 60)
 
+    mode_str = "[DRY]" if dry_run else "[LIVE]"
     while True:
+        tick_start = time.monotonic()
         try:
             now = datetime.now(timezone.utc)
 
+            # Fetch BTC price, the open market and pending settlements concurrently;
+            # one signed request covers every pending trade's market
+            pending_tickers = dict.fromkeys(
+                t["buy_ticker"] for t in trades
+                if not t.get("outcome") and t.get("buy_ticker")
+            )
+            btc_future = HTTP_POOL.submit(get_btc_price, client.session)
+            market_future = HTTP_POOL.submit(get_open_market, client)
+            settle_future = (
+                HTTP_POOL.submit(client.get_markets_by_tickers, pending_tickers)
+                if pending_tickers
+                else None
+            )
+
             try:
-                btc_price = get_btc_price()
+                btc_price = btc_future.result()
                 btc_prices.append((now, btc_price))
+                btc_times.append(now)
             except Exception as e:
                 btc_price = None
                 print(f"  [BTC price error: {e}]")
 
-            market = get_open_market(client)
+            market = market_future.result()
 
             if not market:
                 print(f"[{now.strftime('%H:%M:%S')}] No open market found")
-                time.sleep(POLL_SECONDS)
+                sleep_until_next_tick(tick_start)
                 continue
 
             ticker = market["ticker"]
@@ -335,11 +416,7 @@ def main():
             no_ask = market.get("no_ask", 0) / 100
 
             close_time_str = market.get("close_time", "")
-            close_time = (
-                datetime.fromisoformat(close_time_str.replace("Z", "+00:00"))
-                if close_time_str
-                else None
-            )
+            close_time = parse_close_time(close_time_str) if close_time_str else None
             time_to_close = (close_time - now).total_seconds() if close_time else None
 
             if current_ticker is None:
@@ -349,17 +426,24 @@ def main():
                 current_ticker = ticker
                 print(f"  Market changed: {pending_previous} -> {ticker}")
 
+            settle_markets = {}
+            if settle_future:
+                try:
+                    settle_markets = settle_future.result()
+                except Exception:
+                    pass
+
             updated = False
             for trade in trades:
                 if trade.get("outcome"):
                     continue
 
                 buy_ticker = trade.get("buy_ticker")
-                if not buy_ticker:
+                m = settle_markets.get(buy_ticker)
+                if not m:
                     continue
 
                 try:
-                    m = client.get_market(buy_ticker)
                     result = get_settled_side(m)
                     if result:
                         buy_side = trade.get("buy_side")
@@ -373,6 +457,7 @@ def main():
                         trade["outcome"] = "WIN" if won else "LOSS"
                         trade["payout_usd"] = round(payout, 4)
                         trade["profit_usd"] = round(profit, 4)
+                        stats_settle(stats, trade)
                         updated = True
 
                         print(
@@ -384,46 +469,44 @@ def main():
             if updated:
                 save_trades(trades)
 
-            stats = calc_stats(trades)
             btc_str = f"BTC=${btc_price:,.0f}" if btc_price else "BTC=?"
             time_str = f"{time_to_close:.0f}s" if time_to_close else "?"
-            mode_str = "[DRY]" if dry_run else "[LIVE]"
-            print(
-                f"[{now.strftime('%H:%M:%S')}] {mode_str} {ticker} ({time_str}) | "
+            sys.stdout.write(
+                f"[{now:%H:%M:%S}] {mode_str} {ticker} ({time_str}) | "
                 f"yes=${yes_ask:.2f} no=${no_ask:.2f} | {btc_str} | "
-                f"P&L: ${stats['total_profit']:+.2f}"
+                f"P&L: ${stats['total_profit']:+.2f}\n"
             )
 
             # Wait for market rollover before evaluating this strategy.
             if not pending_previous:
-                time.sleep(POLL_SECONDS)
+                sleep_until_next_tick(tick_start)
                 continue
 
             if ticker in traded_tickers:
-                time.sleep(POLL_SECONDS)
+                sleep_until_next_tick(tick_start)
                 continue
 
             cutoff = now - timedelta(seconds=MOMENTUM_15_WINDOW_SECONDS)
-            old_prices = [(t, p) for t, p in btc_prices if t <= cutoff]
+            old_price = price_at_or_before(btc_times, btc_prices, cutoff)
 
-            if not old_prices:
+            if old_price is None:
                 print(
                     f"  Waiting for full {MOMENTUM_15_WINDOW_SECONDS}s BTC history "
                     f"before trading {ticker}"
                 )
-                time.sleep(POLL_SECONDS)
+                sleep_until_next_tick(tick_start)
                 continue
 
-            _, old_price = old_prices[-1]
             _, current_price = btc_prices[-1]
-            side = "yes" if current_price > old_price else "no"
+            went_up = current_price > old_price
+            side = ("no", "yes")[went_up]
+            price = (no_ask, yes_ask)[went_up]
             pct_change = ((current_price - old_price) / old_price) * 100
 
-            price = yes_ask if side == "yes" else no_ask
             if price <= 0:
                 print(f"  Invalid price ${price:.4f}, skipping {ticker}")
                 traded_tickers.add(ticker)
-                time.sleep(POLL_SECONDS)
+                sleep_until_next_tick(tick_start)
                 continue
 
             contracts = int(STAKE_USD / price)
@@ -433,11 +516,10 @@ def main():
             stake_actual = contracts * price
             price_cents = int(price * 100)
 
-            print()
-            print(f"  >>> MOMENTUM_15 SIGNAL: {side.upper()} (BTC15 {pct_change:+.3f}%) <<<")
-            print(
+            sys.stdout.write(
+                f"\n  >>> MOMENTUM_15 SIGNAL: {side.upper()} (BTC15 {pct_change:+.3f}%) <<<\n"
                 f"  Placing order: BUY {contracts} {side} @ ${price:.2f} "
-                f"(${stake_actual:.2f} total)"
+                f"(${stake_actual:.2f} total)\n"
             )
 
             try:
@@ -468,7 +550,8 @@ def main():
                     "profit_usd": "",
                 }
                 trades.append(trade)
-                save_trades(trades)
+                append_trade(trade)
+                stats_add(stats, trade)
                 traded_tickers.add(ticker)
                 pending_previous = None
             except Exception as e:
@@ -476,26 +559,29 @@ def main():
                 traded_tickers.add(ticker)
 
             print()
-            time.sleep(POLL_SECONDS)
+            sleep_until_next_tick(tick_start)
 
         except KeyboardInterrupt:
-            print("\n")
-            print("=" * 60)
-            print("STOPPED - FINAL STATS")
-            print("=" * 60)
-            stats = calc_stats(trades)
-            print(f"Total trades: {len(trades)}")
-            print(f"Wins: {stats['wins']} | Losses: {stats['losses']} | Pending: {stats['pending']}")
-            print(f"Total staked: ${stats['total_staked']:.2f}")
-            print(f"Total profit: ${stats['total_profit']:+.2f}")
+            rule = "=" * 60
+            out = [
+                "\n",
+                rule,
+                "STOPPED - FINAL STATS",
+                rule,
+                f"Total trades: {len(trades)}",
+                f"Wins: {stats['wins']} | Losses: {stats['losses']} | Pending: {stats['pending']}",
+                f"Total staked: ${stats['total_staked']:.2f}",
+                f"Total profit: ${stats['total_profit']:+.2f}",
+            ]
             if stats["total_staked"] > 0:
                 roi = (stats["total_profit"] / stats["total_staked"]) * 100
-                print(f"ROI: {roi:.1f}%")
+                out.append(f"ROI: {roi:.1f}%")
+            sys.stdout.write("\n".join(out) + "\n")
             break
 
         except Exception as e:
             print(f"Error: {e}")
-            time.sleep(POLL_SECONDS)
+            sleep_until_next_tick(tick_start)
 
     return 0
 